@@ -7,10 +7,22 @@ Monitors slow queries and sends alerts when thresholds are exceeded
 
 import psycopg2
 import pymysql
+from psycopg2.errors import InvalidSqlStatementName
+from psycopg2.extras import RealDictCursor
+from pymysql.cursors import DictCursor
+import json
 import logging
+import queue
+import threading
 import time
 import sys
+import urllib.request
+from collections import OrderedDict, namedtuple
+from itertools import islice, takewhile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
 from typing import List, Dict, Optional
 
 logging.basicConfig(
@@ -19,6 +31,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One running slow query; wait_event_* are only reported by PostgreSQL
+SlowQuery = namedtuple(
+    'SlowQuery',
+    'pid usename datname duration_ms state query_preview wait_event_type wait_event',
+    defaults=(None, None)
+)
+
+
+# Hot monitoring queries, prepared once per PostgreSQL session (see connect()).
+# The monitor's own backend pid and database name are bound as parameters,
+# looked up once per connection rather than re-evaluated every poll.
+_PG_SLOW_QUERY_SQL = """
+    SELECT
+        pid,
+        usename,
+        datname,
+        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
+        state,
+        LEFT(query, 200) AS query_preview,
+        wait_event_type,
+        wait_event
+    FROM pg_stat_activity
+    WHERE state != 'idle'
+        AND pid != $1
+        AND now() - query_start > interval '1 second'
+    ORDER BY duration_ms DESC
+    LIMIT $2;
+    """
+
+# Scalar subqueries so every stat comes back in a single round-trip
+_PG_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM pg_stat_activity
+            WHERE state = 'active') AS active_connections,
+        (SELECT COUNT(*) FROM pg_stat_activity) AS total_connections,
+        pg_size_pretty(pg_database_size($1::name)) AS database_size,
+        (SELECT ROUND(
+            100 * sum(blks_hit) / NULLIF(sum(blks_hit) + sum(blks_read), 0), 2
+        ) FROM pg_stat_database
+            WHERE datname = $1::name) AS cache_hit_ratio;
+    """
+
+_PG_PREPARED_STATEMENTS = MappingProxyType({
+    'mon_slow_queries': _PG_SLOW_QUERY_SQL,
+    'mon_stats': _PG_STATS_SQL,
+})
+
+# MySQL counterparts, sent as plain text queries (pymysql has no server-side prepare)
+_MYSQL_SLOW_QUERY_SQL = """
+    SELECT
+        Id AS pid,
+        User AS usename,
+        db AS datname,
+        Time * 1000 AS duration_ms,
+        State AS state,
+        LEFT(Info, 200) AS query_preview
+    FROM information_schema.PROCESSLIST
+    WHERE Command != 'Sleep'
+        AND Time > 1
+        AND Id != CONNECTION_ID()
+    ORDER BY Time DESC
+    LIMIT %s;
+    """
+
+_MYSQL_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM information_schema.PROCESSLIST
+            WHERE Command != 'Sleep') AS active_connections,
+        (SELECT COUNT(*) FROM information_schema.PROCESSLIST) AS total_connections,
+        (SELECT CONCAT(ROUND(SUM(data_length + index_length) / 1024 / 1024, 2), ' MB')
+            FROM information_schema.TABLES
+            WHERE table_schema = DATABASE()) AS database_size;
+    """
+
+# Errors meaning the connection itself is unusable and must be re-opened
+_CONNECTION_ERRORS = (
+    psycopg2.OperationalError,
+    psycopg2.InterfaceError,
+    pymysql.err.OperationalError,
+    pymysql.err.InterfaceError,
+)
+
 
 class DatabaseMonitor:
     """Monitor database performance and alert on issues"""
@@ -30,239 +124,359 @@ class DatabaseMonitor:
         Args:
             connection_params: Database connection parameters
             db_type: 'postgresql' or 'mysql'
+        
+        Raises:
+            ValueError: If db_type is not supported
         """
         self.conn_params = connection_params
         self.db_type = db_type.lower()
+        
+        # Bind the backend-specific fetchers once instead of dispatching
+        # on db_type every check
+        if self.db_type == 'postgresql':
+            self.get_slow_queries = self.get_slow_queries_postgresql
+            self.get_database_stats = self.get_database_stats_postgresql
+        elif self.db_type == 'mysql':
+            self.get_slow_queries = self.get_slow_queries_mysql
+            self.get_database_stats = self.get_database_stats_mysql
+        else:
+            raise ValueError(f"Unsupported database type: {self.db_type}")
+        
         self.slow_query_threshold = 1000  # milliseconds
+        self.alert_query_threshold = 5000  # milliseconds
+        self.alert_dedup_window = 600  # seconds before re-alerting the same query
+        self.max_rows = 100  # cap on slow queries fetched per check
+        self.failure_alert_threshold = 3  # consecutive connection failures
+        self.alert_webhook_url: Optional[str] = None  # JSON POST target; None = log only
+        self.alert_batch_window = 5  # seconds to coalesce alerts into one delivery
         self.connection = None
+        self._backend_pid = None  # PostgreSQL session constants, set by connect()
+        self._db_name = None
+        self._consecutive_failures = 0
+        # (pid, preview hash) -> monotonic time of last alert, oldest first
+        self._recent_alerts = OrderedDict()
+        
+        # Stats are fetched on a second, lazily opened connection so their
+        # round-trip overlaps the slow-query fetch on the main one
+        self._stats_connection = None
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Alerts are queued by the checks and delivered in batches by a
+        # background worker that lives as long as the connection
+        self._alert_queue = queue.Queue()
+        self._alert_thread = None
         
+    def _open_connection(self):
+        """Open and prepare a new connection for the configured database"""
+        if self.db_type == 'postgresql':
+            connection = psycopg2.connect(**self.conn_params)
+            # Without autocommit the session sits in one long transaction,
+            # freezing now() and the pg_stat_activity snapshot between polls
+            connection.autocommit = True
+            self._prepare_statements(connection)
+            return connection
+        return pymysql.connect(**self.conn_params)
+    
     def connect(self) -> bool:
         """Establish database connection"""
+        if self._alert_thread is None:
+            self._alert_thread = threading.Thread(
+                target=self._alert_worker, name='alert-sink', daemon=True
+            )
+            self._alert_thread.start()
+        
         try:
+            self.connection = self._open_connection()
             if self.db_type == 'postgresql':
-                self.connection = psycopg2.connect(**self.conn_params)
-            elif self.db_type == 'mysql':
-                self.connection = pymysql.connect(**self.conn_params)
-            else:
-                raise ValueError(f"Unsupported database type: {self.db_type}")
+                with self.connection.cursor() as cur:
+                    cur.execute("SELECT pg_backend_pid(), current_database()")
+                    self._backend_pid, self._db_name = cur.fetchone()
             
-            logger.info(f"✓ Connected to {self.db_type} database")
+            logger.info("✓ Connected to %s database", self.db_type)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             return False
     
     def disconnect(self):
-        """Close database connection"""
+        """Close database connection and flush pending alerts"""
+        if self._alert_thread is not None:
+            self._alert_queue.put(None)
+            self._alert_thread.join()
+            self._alert_thread = None
+        
+        with self._stats_lock:
+            if self._stats_connection:
+                self._stats_connection.close()
+                self._stats_connection = None
+        
         if self.connection:
             self.connection.close()
+            self.connection = None
             logger.info("Database connection closed")
     
-    def get_slow_queries_postgresql(self) -> List[Dict]:
-        """Fetch currently running slow queries (PostgreSQL)"""
-        query = """
-        SELECT 
-            pid,
-            usename,
-            datname,
-            EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
-            state,
-            wait_event_type,
-            wait_event,
-            LEFT(query, 200) AS query_preview
-        FROM pg_stat_activity
-        WHERE state != 'idle'
-            AND pid != pg_backend_pid()
-            AND now() - query_start > interval '1 second'
-        ORDER BY duration_ms DESC;
+    def _record_connection_failure(self):
+        """Count a connection failure, alerting once when the threshold is hit"""
+        self._consecutive_failures += 1
+        if self._consecutive_failures == self.failure_alert_threshold:
+            self.enqueue_alert(
+                "Database Connection Lost",
+                f"{self._consecutive_failures} consecutive connection failures, still retrying"
+            )
+    
+    def _reconnect(self, max_backoff: float, deadline: Optional[float] = None) -> bool:
         """
+        Re-open the connection with exponential backoff (1s, 2s, 4s, ...)
+        
+        Args:
+            max_backoff: Upper bound for the wait between attempts in seconds
+            deadline: time.monotonic() value after which to give up (None = never)
+        
+        Returns:
+            True once reconnected, False if the deadline passed first
+        """
+        backoff = 1
+        while deadline is None or time.monotonic() < deadline:
+            self.disconnect()
+            time.sleep(backoff)
+            if self.connect():
+                return True
+            
+            self._record_connection_failure()
+            backoff = min(max_backoff, backoff * 2)
         
+        return False
+    
+    def _prepare_statements(self, connection):
+        """Prepare the hot monitoring queries for a PostgreSQL session"""
+        # Send every PREPARE through one cursor in a single round-trip
+        with connection.cursor() as cur:
+            cur.execute(";".join(
+                f"PREPARE {name} AS {query.strip().rstrip(';')}"
+                for name, query in _PG_PREPARED_STATEMENTS.items()
+            ))
+    
+    def _execute_prepared(self, cur, name: str, params: tuple = ()):
+        """Execute a prepared statement, re-preparing it if the session lost it"""
+        statement = f"EXECUTE {name}"
+        if params:
+            statement += f"({', '.join(['%s'] * len(params))})"
+        
+        try:
+            cur.execute(statement, params or None)
+        except InvalidSqlStatementName:
+            # Session was reset underneath us (e.g. DISCARD ALL from a pooler)
+            cur.execute(f"PREPARE {name} AS {_PG_PREPARED_STATEMENTS[name]}")
+            cur.execute(statement, params or None)
+    
+    def get_slow_queries_postgresql(self) -> List[SlowQuery]:
+        """Fetch currently running slow queries (PostgreSQL)"""
         try:
             with self.connection.cursor() as cur:
-                cur.execute(query)
-                columns = [desc[0] for desc in cur.description]
-                results = cur.fetchall()
-                
-                slow_queries = []
-                for row in results:
-                    slow_queries.append(dict(zip(columns, row)))
+                self._execute_prepared(
+                    cur, 'mon_slow_queries', (self._backend_pid, self.max_rows)
+                )
+                if not cur.rowcount:  # the usual, healthy case
+                    return []
                 
-                return slow_queries
+                # Columns are selected in SlowQuery field order. Iterating the
+                # cursor converts rows straight out of the libpq result instead
+                # of first copying them all into a list of tuples.
+                return [SlowQuery._make(row) for row in islice(cur, self.max_rows)]
                 
+        except _CONNECTION_ERRORS:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching slow queries: {e}")
+            logger.error("Error fetching slow queries: %s", e)
             return []
     
-    def get_slow_queries_mysql(self) -> List[Dict]:
+    def get_slow_queries_mysql(self) -> List[SlowQuery]:
         """Fetch currently running slow queries (MySQL)"""
-        query = """
-        SELECT 
-            Id AS pid,
-            User AS usename,
-            db AS datname,
-            Time AS duration_seconds,
-            State AS state,
-            LEFT(Info, 200) AS query_preview
-        FROM information_schema.PROCESSLIST
-        WHERE Command != 'Sleep'
-            AND Time > 1
-            AND Id != CONNECTION_ID()
-        ORDER BY Time DESC;
-        """
-        
         try:
             with self.connection.cursor() as cur:
-                cur.execute(query)
-                results = cur.fetchall()
-                
-                slow_queries = []
-                for row in results:
-                    slow_queries.append({
-                        'pid': row[0],
-                        'usename': row[1],
-                        'datname': row[2],
-                        'duration_ms': row[3] * 1000,  # Convert to ms
-                        'state': row[4],
-                        'query_preview': row[5]
-                    })
+                cur.execute(_MYSQL_SLOW_QUERY_SQL, (self.max_rows,))
+                if not cur.rowcount:  # the usual, healthy case
+                    return []
                 
-                return slow_queries
+                return [SlowQuery(*row) for row in cur.fetchmany(self.max_rows)]
                 
+        except _CONNECTION_ERRORS:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching slow queries: {e}")
+            logger.error("Error fetching slow queries: %s", e)
             return []
     
-    def get_slow_queries(self) -> List[Dict]:
-        """Get slow queries based on database type"""
-        if self.db_type == 'postgresql':
-            return self.get_slow_queries_postgresql()
-        elif self.db_type == 'mysql':
-            return self.get_slow_queries_mysql()
-        return []
-    
-    def get_database_stats_postgresql(self) -> Dict:
+    def get_database_stats_postgresql(self, connection=None) -> Dict:
         """Get overall database statistics (PostgreSQL)"""
-        queries = {
-            'active_connections': """
-                SELECT COUNT(*) FROM pg_stat_activity 
-                WHERE state = 'active';
-            """,
-            'total_connections': """
-                SELECT COUNT(*) FROM pg_stat_activity;
-            """,
-            'database_size': """
-                SELECT pg_size_pretty(pg_database_size(current_database()));
-            """,
-            'cache_hit_ratio': """
-                SELECT ROUND(
-                    100 * sum(blks_hit) / NULLIF(sum(blks_hit) + sum(blks_read), 0), 2
-                ) FROM pg_stat_database WHERE datname = current_database();
-            """
-        }
-        
-        stats = {}
         try:
-            with self.connection.cursor() as cur:
-                for stat_name, query in queries.items():
-                    cur.execute(query)
-                    result = cur.fetchone()
-                    stats[stat_name] = result[0] if result else None
-            
-            return stats
+            with (connection or self.connection).cursor(cursor_factory=RealDictCursor) as cur:
+                self._execute_prepared(cur, 'mon_stats', (self._db_name,))
+                return cur.fetchone() or {}
             
+        except _CONNECTION_ERRORS:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching database stats: {e}")
+            logger.error("Error fetching database stats: %s", e)
             return {}
     
-    def get_database_stats_mysql(self) -> Dict:
+    def get_database_stats_mysql(self, connection=None) -> Dict:
         """Get overall database statistics (MySQL)"""
-        queries = {
-            'active_connections': """
-                SELECT COUNT(*) FROM information_schema.PROCESSLIST 
-                WHERE Command != 'Sleep';
-            """,
-            'total_connections': """
-                SELECT COUNT(*) FROM information_schema.PROCESSLIST;
-            """,
-            'database_size': """
-                SELECT CONCAT(ROUND(SUM(data_length + index_length) / 1024 / 1024, 2), ' MB')
-                FROM information_schema.TABLES 
-                WHERE table_schema = DATABASE();
-            """
-        }
-        
-        stats = {}
         try:
-            with self.connection.cursor() as cur:
-                for stat_name, query in queries.items():
-                    cur.execute(query)
-                    result = cur.fetchone()
-                    stats[stat_name] = result[0] if result else None
-            
-            return stats
+            with (connection or self.connection).cursor(DictCursor) as cur:
+                cur.execute(_MYSQL_STATS_SQL)
+                return cur.fetchone() or {}
             
+        except _CONNECTION_ERRORS:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching database stats: {e}")
+            logger.error("Error fetching database stats: %s", e)
             return {}
     
-    def get_database_stats(self) -> Dict:
-        """Get database statistics based on type"""
-        if self.db_type == 'postgresql':
-            return self.get_database_stats_postgresql()
-        elif self.db_type == 'mysql':
-            return self.get_database_stats_mysql()
-        return {}
+    def _get_database_stats_concurrent(self) -> Dict:
+        """Get database statistics on the dedicated stats connection"""
+        with self._stats_lock:
+            if self._stats_connection is None:
+                try:
+                    self._stats_connection = self._open_connection()
+                except Exception as e:
+                    logger.error("Failed to open stats connection: %s", e)
+                    return {}
+            
+            return self.get_database_stats(self._stats_connection)
+    
+    def enqueue_alert(self, subject: str, message: str):
+        """Queue an alert for batched delivery; never blocks on the network"""
+        self._alert_queue.put({
+            'subject': subject,
+            'message': message,
+            'time': datetime.now().isoformat()
+        })
     
     def send_alert(self, subject: str, message: str):
-        """Send alert (placeholder - implement email/slack/etc)"""
-        logger.warning(f"ALERT: {subject}")
-        logger.warning(f"Message: {message}")
-        # TODO: Implement actual alerting (email, Slack, PagerDuty, etc.)
+        """Deliver a single alert immediately"""
+        self._deliver_alerts([{
+            'subject': subject,
+            'message': message,
+            'time': datetime.now().isoformat()
+        }])
+    
+    def _alert_worker(self):
+        """Coalesce queued alerts within alert_batch_window and deliver each batch"""
+        while True:
+            alert = self._alert_queue.get()
+            if alert is None:
+                return
+            
+            batch = [alert]
+            deadline = time.monotonic() + self.alert_batch_window
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    alert = self._alert_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if alert is None:
+                    # Stopping: flush what we have, then exit
+                    self._deliver_alerts(batch)
+                    return
+                batch.append(alert)
+            
+            self._deliver_alerts(batch)
+    
+    def _deliver_alerts(self, alerts: List[Dict]):
+        """Log a batch of alerts and POST it as one JSON payload if a webhook is set"""
+        for alert in alerts:
+            logger.warning("ALERT: %s", alert['subject'])
+            logger.warning("Message: %s", alert['message'])
+        
+        if not self.alert_webhook_url:
+            return
+        
+        request = urllib.request.Request(
+            self.alert_webhook_url,
+            data=json.dumps(alerts).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10):
+                pass
+        except Exception as e:
+            logger.error("Failed to deliver %d alert(s): %s", len(alerts), e)
+    
+    def _expire_recent_alerts(self, now: float):
+        """Forget slow-query alerts older than the dedup window"""
+        cutoff = now - self.alert_dedup_window
+        while self._recent_alerts:
+            key, alerted_at = next(iter(self._recent_alerts.items()))
+            if alerted_at >= cutoff:
+                break
+            del self._recent_alerts[key]
     
     def check_and_alert(self) -> Dict:
         """Check for slow queries and other issues, send alerts if needed"""
         logger.info("=" * 70)
         logger.info("Database Performance Check")
         logger.info("=" * 70)
-        logger.info(f"Time: {datetime.now()}")
-        logger.info(f"Database: {self.db_type}")
+        logger.info("Time: %s", datetime.now())
+        logger.info("Database: %s", self.db_type)
+        
+        # Start the stats fetch so it overlaps the slow-query fetch
+        stats_future = self._executor.submit(self._get_database_stats_concurrent)
         
         # Get slow queries
         slow_queries = self.get_slow_queries()
         
         if slow_queries:
-            logger.warning(f"⚠ Found {len(slow_queries)} slow queries:")
-            for i, query in enumerate(slow_queries, 1):
-                duration = query.get('duration_ms', 0)
-                preview = query.get('query_preview', 'N/A')
-                pid = query.get('pid', 'N/A')
+            logger.warning("⚠ Found %d slow queries:", len(slow_queries))
+            if len(slow_queries) >= self.max_rows:
+                logger.warning("  (list truncated at max_rows=%d, longest first)", self.max_rows)
+            if logger.isEnabledFor(logging.WARNING):
+                for i, query in enumerate(slow_queries, 1):
+                    pid, duration = query.pid, query.duration_ms
+                    preview = query.query_preview or ''  # Info/query can be NULL
+                    
+                    logger.warning("  %d. PID %s: %.2fms", i, pid, duration)
+                    logger.warning("     Query: %.80s...", preview)
+            
+            # Send alert for very slow queries (> 5 seconds). Rows come back
+            # longest first, so only the leading run can cross the threshold.
+            threshold = self.alert_query_threshold
+            now = time.monotonic()
+            self._expire_recent_alerts(now)
+            for query in takewhile(lambda q: q.duration_ms > threshold, slow_queries):
+                pid, duration = query.pid, query.duration_ms
+                preview = query.query_preview or ''
                 
-                logger.warning(f"  {i}. PID {pid}: {duration:.2f}ms")
-                logger.warning(f"     Query: {preview[:80]}...")
+                # A stuck query is only alerted once per dedup window
+                key = (pid, hash(preview))
+                if key in self._recent_alerts:
+                    continue
+                self._recent_alerts[key] = now
                 
-                # Send alert for very slow queries (> 5 seconds)
-                if duration > 5000:
-                    self.send_alert(
-                        f"Very Slow Query Detected (PID {pid})",
-                        f"Query running for {duration/1000:.2f}s:\n{preview}"
-                    )
+                self.enqueue_alert(
+                    f"Very Slow Query Detected (PID {pid})",
+                    f"Query running for {duration/1000:.2f}s:\n{preview}"
+                )
         else:
             logger.info("✓ No slow queries detected")
         
         # Get database statistics
-        stats = self.get_database_stats()
+        stats = stats_future.result()
         
         logger.info("")
         logger.info("Database Statistics:")
         for stat_name, value in stats.items():
-            logger.info(f"  {stat_name}: {value}")
+            logger.info("  %s: %s", stat_name, value)
         
         # Check for connection issues
         if stats.get('active_connections'):
             active = stats['active_connections']
             if active > 100:  # Threshold for alert
-                self.send_alert(
+                self.enqueue_alert(
                     "High Active Connection Count",
                     f"Active connections: {active}"
                 )
@@ -271,7 +485,7 @@ class DatabaseMonitor:
         if 'cache_hit_ratio' in stats:
             cache_ratio = stats['cache_hit_ratio']
             if cache_ratio and cache_ratio < 95:
-                self.send_alert(
+                self.enqueue_alert(
                     "Low Cache Hit Ratio",
                     f"Cache hit ratio: {cache_ratio}% (should be > 95%)"
                 )
@@ -293,38 +507,73 @@ class DatabaseMonitor:
             interval: Check interval in seconds (default: 60)
             duration: Total monitoring duration in seconds (None = infinite)
         """
-        logger.info(f"Starting continuous monitoring (interval: {interval}s)")
+        logger.info("Starting continuous monitoring (interval: %ss)", interval)
         
         if not self.connect():
             logger.error("Failed to connect to database")
             return
         
-        start_time = time.time()
+        # Monotonic clock so NTP/wall-clock jumps don't disturb the schedule
+        start_time = time.monotonic()
+        next_check = start_time
         check_count = 0
         
         try:
             while True:
                 check_count += 1
-                logger.info(f"Check #{check_count}")
+                logger.info("Check #%d", check_count)
                 
-                self.check_and_alert()
+                try:
+                    self.check_and_alert()
+                    self._consecutive_failures = 0
+                except _CONNECTION_ERRORS as e:
+                    logger.error("Lost database connection: %s", e)
+                    self._record_connection_failure()
+                    deadline = start_time + duration if duration else None
+                    if not self._reconnect(max_backoff=interval, deadline=deadline):
+                        logger.info("Monitoring duration limit reached (%ss)", duration)
+                        break
                 
                 # Check if duration limit reached
-                if duration and (time.time() - start_time) >= duration:
-                    logger.info(f"Monitoring duration limit reached ({duration}s)")
+                if duration and (time.monotonic() - start_time) >= duration:
+                    logger.info("Monitoring duration limit reached (%ss)", duration)
                     break
                 
-                # Wait for next check
-                time.sleep(interval)
+                # Wait for next check, counting the time the check itself took
+                next_check += interval
+                sleep_for = next_check - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    # Overran the slot; resume from now instead of bursting to catch up
+                    next_check = time.monotonic()
                 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
         except Exception as e:
-            logger.error(f"Monitoring error: {e}", exc_info=True)
+            logger.error("Monitoring error: %s", e, exc_info=True)
         finally:
             self.disconnect()
 
 
+def start_log_listener() -> QueueListener:
+    """
+    Move the root logger's handlers onto a background listener thread
+    
+    The monitoring thread then only enqueues log records, so slow handlers
+    (files, syslog, remote sinks) no longer delay the next database poll.
+    
+    Returns:
+        The running listener; call stop() on it to flush pending records
+    """
+    root = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point for command-line usage"""
     
@@ -356,12 +605,13 @@ def main():
     
     # Create monitor
     monitor = DatabaseMonitor(config, db_type=db_type)
-    
-    # Connect and check
-    if not monitor.connect():
-        sys.exit(1)
+    log_listener = start_log_listener()
     
     try:
+        # Connect and check
+        if not monitor.connect():
+            sys.exit(1)
+        
         # One-time check
         result = monitor.check_and_alert()
         
@@ -374,10 +624,11 @@ def main():
         # monitor.monitor(interval=60)  # Check every 60 seconds
         
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         monitor.disconnect()
+        log_listener.stop()
 
 
 if __name__ == "__main__":